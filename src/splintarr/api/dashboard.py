@@ -50,7 +50,7 @@ from splintarr.core.auth import (
     get_current_user_id_from_token,
 )
 from splintarr.core.rate_limit import rate_limit_key_func
-from splintarr.core.security import decrypt_field, encrypt_field, hash_password
+from splintarr.core.security import decrypt_field, decrypt_webhook_url, encrypt_field, hash_password
 from splintarr.core.ssrf_protection import SSRFError, validate_instance_url
 from splintarr.database import database_health_check, get_db
 from splintarr.models.instance import Instance
@@ -1018,21 +1018,23 @@ def _get_queue_alltime_stats(db: Session, queue_id: int) -> dict[str, dict[str,
         bucket["total_found"] += row.items_found or 0
         bucket["total_searched"] += row.searches_triggered or 0
 
-        # Count grabs from search_metadata JSON
-        if row.search_metadata:
+        # Count grabs from search_metadata (legacy rows may still hold a JSON string)
+        entries = row.search_metadata
+        if isinstance(entries, str):
             try:
-                entries = json.loads(row.search_metadata)
-                if isinstance(entries, list):
-                    for entry in entries:
-                        if isinstance(entry, dict) and entry.get("result") == "grabbed":
-                            bucket["total_grabbed"] += 1
-            except (json.JSONDecodeError, TypeError) as e:
+                entries = json.loads(entries)
+            except json.JSONDecodeError as e:
                 logger.warning(
                     "queue_stats_metadata_parse_failed",
                     queue_id=queue_id,
                     strategy=row.strategy,
                     error=str(e),
                 )
+                entries = None
+        if isinstance(entries, list):
+            for entry in entries:
+                if isinstance(entry, dict) and entry.get("result") == "grabbed":
+                    bucket["total_grabbed"] += 1
 
     return stats
 
@@ -1276,17 +1278,18 @@ async def get_dashboard_stats(db: Session, user: User) -> dict[str, Any]:
 
     total_grabs = 0
     total_checked = 0
-    for (metadata_json,) in recent_histories:
-        try:
-            entries = json.loads(metadata_json)
-            if isinstance(entries, list):
-                for entry in entries:
-                    if isinstance(entry, dict) and entry.get("result") in ("grabbed", "no grab"):
-                        total_checked += 1
-                        if entry.get("result") == "grabbed":
-                            total_grabs += 1
-        except (json.JSONDecodeError, TypeError):
-            continue
+    for (metadata,) in recent_histories:
+        if isinstance(metadata, str):  # legacy rows stored a JSON string
+            try:
+                metadata = json.loads(metadata)
+            except json.JSONDecodeError:
+                continue
+        if isinstance(metadata, list):
+            for entry in metadata:
+                if isinstance(entry, dict) and entry.get("result") in ("grabbed", "no grab"):
+                    total_checked += 1
+                    if entry.get("result") == "grabbed":
+                        total_grabs += 1
 
     grab_rate = round(total_grabs / total_checked * 100, 1) if total_checked > 0 else 0.0
 
@@ -1510,12 +1513,13 @@ async def api_dashboard_analytics(
     )
 
     series_counts: dict[str, int] = {}
-    for (metadata_json,) in history_rows:
-        try:
-            entries = json.loads(metadata_json) if metadata_json else []
-        except (json.JSONDecodeError, TypeError):
-            continue
-        for entry in entries:
+    for (metadata,) in history_rows:
+        if isinstance(metadata, str):  # legacy rows stored a JSON string
+            try:
+                metadata = json.loads(metadata)
+            except json.JSONDecodeError:
+                continue
+        for entry in metadata if isinstance(metadata, list) else []:
             if not isinstance(entry, dict):
                 continue
             item_name = entry.get("item", "")
@@ -1663,7 +1667,7 @@ async def api_indexer_health(
                 .first()
             )
             if notif_config and notif_config.is_event_enabled("budget_alert"):
-                webhook_url = decrypt_field(notif_config.webhook_url)
+                webhook_url = decrypt_webhook_url(notif_config.webhook_url)
                 service = DiscordNotificationService(webhook_url)
                 for alert in alerts:
                     await service.send_budget_alert(**alert)
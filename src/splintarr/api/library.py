@@ -171,7 +171,7 @@ async def _notify_library_sync(
 ) -> None:
     """Send Discord notification for library sync completion if configured."""
     try:
-        from splintarr.core.security import decrypt_field
+        from splintarr.core.security import decrypt_webhook_url
         from splintarr.models.notification import NotificationConfig
         from splintarr.services.discord import DiscordNotificationService
 
@@ -185,7 +185,7 @@ async def _notify_library_sync(
             if not config or not config.is_event_enabled("library_sync"):
                 return
 
-            webhook_url = decrypt_field(config.webhook_url)
+            webhook_url = decrypt_webhook_url(config.webhook_url)
             service = DiscordNotificationService(webhook_url)
             await service.send_library_sync(
                 items_synced=items_synced,
@@ -205,7 +205,7 @@ async def _notify_library_sync(
 async def _notify_library_sync_started(instance_count: int) -> None:
     """Send Discord notification for library sync start if configured."""
     try:
-        from splintarr.core.security import decrypt_field
+        from splintarr.core.security import decrypt_webhook_url
         from splintarr.models.notification import NotificationConfig
         from splintarr.services.discord import DiscordNotificationService
 
@@ -219,7 +219,7 @@ async def _notify_library_sync_started(instance_count: int) -> None:
             if not config or not config.is_event_enabled("library_sync"):
                 return
 
-            webhook_url = decrypt_field(config.webhook_url)
+            webhook_url = decrypt_webhook_url(config.webhook_url)
             service = DiscordNotificationService(webhook_url)
             await service.send_library_sync_started(instance_count=instance_count)
         finally:
@@ -22,7 +22,7 @@ from slowapi.util import get_remote_address
 from sqlalchemy.orm import Session
 
 from splintarr.core.auth import get_current_user_from_cookie
-from splintarr.core.security import decrypt_field, encrypt_field
+from splintarr.core.security import decrypt_webhook_url, encrypt_webhook_url
 from splintarr.database import get_db
 from splintarr.models.notification import DEFAULT_EVENTS, NotificationConfig
 from splintarr.models.user import User
@@ -135,7 +135,7 @@ async def save_notification_config(
         db.query(NotificationConfig).filter(NotificationConfig.user_id == current_user.id).first()
     )
 
-    encrypted_url = encrypt_field(payload.webhook_url)
+    encrypted_url = encrypt_webhook_url(payload.webhook_url)
     events = payload.events_enabled if payload.events_enabled else DEFAULT_EVENTS.copy()
 
     if config:
@@ -195,7 +195,7 @@ async def test_notification(
         )
 
     try:
-        webhook_url = decrypt_field(config.webhook_url)
+        webhook_url = decrypt_webhook_url(config.webhook_url)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -33,21 +33,23 @@ def _timeago(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%d")
 
 
-def _parse_search_log(value: str | None) -> list[dict[str, Any]]:
-    """Parse JSON search_metadata into a list of log entries for template rendering.
+def _parse_search_log(value: list[Any] | str | None) -> list[dict[str, Any]]:
+    """Normalize search_metadata into a list of log entries for template rendering.
 
-    Each entry may contain: item, action, result, reason, error,
-    score, score_reason, grab_confirmed.
+    The JSON column yields a list directly; legacy rows may still hold a
+    JSON string. Each entry may contain: item, action, result, reason,
+    error, score, score_reason, grab_confirmed.
     """
     if not value:
         return []
-    try:
-        data = json.loads(value)
-        if not isinstance(data, list):
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
             return []
-        return [entry for entry in data if isinstance(entry, dict)]
-    except (json.JSONDecodeError, TypeError):
+    if not isinstance(value, list):
         return []
+    return [entry for entry in value if isinstance(entry, dict)]
 
 
 # Register custom filters
@@ -10,15 +10,87 @@ This module provides secure configuration management following OWASP best practi
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
 import structlog
-from pydantic import Field, ValidationError, field_validator, model_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, PrivateAttr, ValidationError, field_validator, model_validator
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 
 logger = structlog.get_logger()
 
+# Cache of secret file contents keyed on path, invalidated by mtime.
+# Secrets are read on hot paths (JWT signing, DB connect) but effectively
+# never change during a process lifetime; caching turns two syscalls +
+# decode + strip per access into a single stat() (or a dict hit).
+_secret_file_cache: dict[str, tuple[int, str]] = {}
+
+# SQLCipher cipher whitelist, hoisted so field validation (which runs on
+# every Settings construction) doesn't rebuild and re-sort it per call.
+_ALLOWED_CIPHERS = frozenset(
+    {
+        "aes-256-cfb",
+        "aes-256-cbc",
+        "aes-128-cfb",
+        "aes-128-cbc",
+    }
+)
+_ALLOWED_CIPHERS_STR = ", ".join(sorted(_ALLOWED_CIPHERS))
+
+
+def _read_secret_file(file_path: str) -> str | None:
+    """Read a Docker secret file through the mtime-keyed cache.
+
+    Returns None if the file does not exist; raises RuntimeError if it
+    exists but cannot be read.
+    """
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _secret_file_cache.get(file_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        value = Path(file_path).read_text().strip()
+    except Exception as e:
+        raise RuntimeError(f"Failed to read secret from {file_path}: {e}") from e
+    _secret_file_cache[file_path] = (mtime_ns, value)
+    return value
+
+
+class SecretFileSettingsSource(PydanticBaseSettingsSource):
+    """
+    Settings source resolving ``*_FILE`` env vars (Docker secrets).
+
+    Injects file contents for the secret fields at construction time, so
+    validators see the real value and runtime accessors never touch disk.
+    Placed ahead of the env source so a Docker secret file takes priority
+    over a plain environment variable, per the documented hierarchy.
+    """
+
+    _SECRET_FIELDS = ("secret_key", "pepper", "database_key")
+
+    def get_field_value(self, field: FieldInfo, field_name: str) -> tuple[str | None, str, bool]:
+        if field_name not in self._SECRET_FIELDS:
+            return None, field_name, False
+        file_path = os.environ.get(f"{field_name.upper()}_FILE")
+        if not file_path:
+            return None, field_name, False
+        return _read_secret_file(file_path), field_name, False
+
+    def __call__(self) -> dict[str, str]:
+        values: dict[str, str] = {}
+        for field_name in self._SECRET_FIELDS:
+            value, key, _ = self.get_field_value(
+                self.settings_cls.model_fields[field_name], field_name
+            )
+            if value:
+                values[key] = value
+        return values
+
 
 class Settings(BaseSettings):
     """
@@ -38,6 +110,24 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Insert the Docker secret file source between init kwargs and env vars."""
+        return (
+            init_settings,
+            SecretFileSettingsSource(settings_cls),
+            env_settings,
+            dotenv_settings,
+            file_secret_settings,
+        )
+
     # Application Settings
     environment: Literal["development", "production", "test"] = Field(
         default="production",
@@ -266,6 +356,10 @@ class Settings(BaseSettings):
         le=10,
     )
 
+    # Per-instance cache of validated secrets so the length check and file
+    # read run once per process rather than on every access.
+    _secret_cache: dict[str, str] = PrivateAttr(default_factory=dict)
+
     def _get_secret(self, name: str, file_path: str | None, env_value: str) -> str:
         """
         Retrieve a secret from file or environment variable.
@@ -274,6 +368,9 @@ class Settings(BaseSettings):
         1. Docker secret file ({name}_FILE)
         2. Environment variable ({name})
 
+        Validated values are memoized on the instance; repeated calls are a
+        dict lookup with no disk I/O.
+
         Args:
             name: Secret name for error messages (e.g., "SECRET_KEY")
             file_path: Optional path to secret file (Docker secret)
@@ -285,6 +382,9 @@ class Settings(BaseSettings):
         Raises:
             RuntimeError: If secret is not configured or is too short
         """
+        cached = self._secret_cache.get(name)
+        if cached is not None:
+            return cached
         value = self._read_secret(file_path, env_value)
         if not value:
             raise RuntimeError(
@@ -292,6 +392,7 @@ class Settings(BaseSettings):
             )
         if len(value) < 32:
             raise RuntimeError(f"{name} must be at least 32 characters (256 bits)")
+        self._secret_cache[name] = value
         return value
 
     def get_secret_key(self) -> str:
@@ -318,16 +419,19 @@ class Settings(BaseSettings):
         Returns:
             str: SQLCipher database URL (without embedded credentials)
         """
-        from urllib.parse import urlparse
-
-        # Extract base path from database_url
-        # Handle both sqlite:/// and sqlite+pysqlcipher:/// schemes
+        # Extract base path from database_url by stripping the scheme directly;
+        # the full urlparse machinery is overkill for a known sqlite URL shape.
+        # Handle both sqlite:/// and sqlite+pysqlcipher:/// schemes.
         if "sqlite" in self.database_url:
-            # Parse the URL to extract just the path (strip scheme and query params)
-            parsed = urlparse(self.database_url)
-            db_path = parsed.path
+            db_path = self.database_url.removeprefix("sqlite+pysqlcipher://").removeprefix(
+                "sqlite://"
+            )
+            # Drop any query params (e.g. ?cipher=...)
+            db_path = db_path.partition("?")[0]
             if not db_path or db_path == "/":
                 db_path = "/data/splintarr.db"
+            elif not db_path.startswith("/"):
+                db_path = "/" + db_path
         else:
             db_path = "/data/splintarr.db"
 
@@ -340,6 +444,12 @@ class Settings(BaseSettings):
         """
         Read secret from file or return environment variable value.
 
+        File contents are cached keyed on mtime, so repeated accesses cost
+        a single stat() instead of a full read + decode + strip. With the
+        SecretFileSettingsSource injecting file contents at construction,
+        env_value normally already holds the secret and this is a fallback
+        for explicitly passed *_file paths.
+
         Args:
             file_path: Optional path to secret file (Docker secret)
             env_value: Value from environment variable
@@ -349,12 +459,9 @@ class Settings(BaseSettings):
         """
         # Try Docker secret file first
         if file_path:
-            secret_path = Path(file_path)
-            if secret_path.exists():
-                try:
-                    return secret_path.read_text().strip()
-                except Exception as e:
-                    raise RuntimeError(f"Failed to read secret from {file_path}: {e}") from e
+            value = _read_secret_file(file_path)
+            if value is not None:
+                return value
 
         # Fall back to environment variable
         return env_value
@@ -389,16 +496,8 @@ class Settings(BaseSettings):
     @classmethod
     def validate_database_cipher(cls, v: str) -> str:
         """Validate cipher algorithm is in whitelist to prevent SQL injection."""
-        allowed_ciphers = {
-            "aes-256-cfb",
-            "aes-256-cbc",
-            "aes-128-cfb",
-            "aes-128-cbc",
-        }
-        if v not in allowed_ciphers:
-            raise ValueError(
-                f"Invalid cipher: {v}. Allowed values: {', '.join(sorted(allowed_ciphers))}"
-            )
+        if v not in _ALLOWED_CIPHERS:
+            raise ValueError(f"Invalid cipher: {v}. Allowed values: {_ALLOWED_CIPHERS_STR}")
         return v
 
     @staticmethod
@@ -462,9 +561,22 @@ class Settings(BaseSettings):
         return self
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings singleton.
+
+    Instantiating Settings re-parses the entire env/.env stack, so the
+    instance is cached; any accidental ``Settings()`` callers should switch
+    to this factory. Tests that need fresh settings should call
+    ``get_settings.cache_clear()``.
+    """
+    return Settings()
+
+
 # Global settings instance
 try:
-    settings = Settings()
+    settings = get_settings()
 except ValidationError as e:
     # Log a generic error without secret values that Pydantic may include in the message.
     # ValidationError.__str__() can contain the raw input values for secret fields.
@@ -14,6 +14,7 @@ import stat
 from collections.abc import Generator
 from typing import Any
 
+import orjson
 import structlog
 from sqlalchemy import create_engine, event, pool, text
 from sqlalchemy.engine import Engine
@@ -27,6 +28,11 @@ logger = structlog.get_logger()
 Base = declarative_base()
 
 
+def _json_serializer(obj: Any) -> str:
+    """Serialize JSON column values with orjson (driver needs str, not bytes)."""
+    return orjson.dumps(obj).decode()
+
+
 def secure_database_file(db_path: str) -> None:
     """
     Set restrictive file permissions on database files.
@@ -172,16 +178,28 @@ def create_database_engine() -> Engine:
             return conn
 
         # Create engine with custom creator
-        # NullPool: SQLCipher requires a fresh connection per operation for thread safety.
+        # QueuePool: each fresh SQLCipher connection re-runs the full key
+        # derivation (database_kdf_iter PBKDF2 rounds), so keyed connections
+        # are pooled and reused rather than re-derived per operation.
         # StaticPool is used in tests for in-memory database sharing.
-        # pool_pre_ping and pool_recycle are not applicable with NullPool.
+        if settings.environment == "test":
+            pool_kwargs: dict[str, Any] = {"poolclass": pool.StaticPool}
+        else:
+            pool_kwargs = {
+                "poolclass": pool.QueuePool,
+                "pool_size": 5,
+                "max_overflow": 5,
+                "pool_pre_ping": True,
+            }
         engine = create_engine(
             database_url,
             creator=creator,
-            poolclass=pool.StaticPool if settings.environment == "test" else pool.NullPool,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
             echo=settings.log_level == "DEBUG",
             echo_pool=settings.log_level == "DEBUG",
             hide_parameters=settings.environment == "production",
+            **pool_kwargs,
         )
 
         logger.info(
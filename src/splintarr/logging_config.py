@@ -11,30 +11,57 @@ This module provides a robust logging setup with:
 - Automatic PII/sensitive data filtering
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
+import re
 import sys
+import threading
 import time
-from collections import defaultdict
-from datetime import datetime
+from collections import defaultdict, deque
 from pathlib import Path
 from typing import Any
 
+import orjson
 import structlog
 
 from splintarr.config import settings
 
 
+def _orjson_serializer(obj: Any, **_: Any) -> str:
+    """Serialize log records with orjson (C extension, ~3-10x stdlib json)."""
+    return orjson.dumps(obj, default=str).decode()
+
+
 def drop_color_message_key(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
     """
     Remove color-related keys from structlog events.
 
     Structlog adds these for console coloring but they shouldn't be in logs.
     """
-    event_dict.pop("color_message", None)
+    # Membership test first: cheaper than pop(..., None) when the key is
+    # absent, which is the common case.
+    if "color_message" in event_dict:
+        del event_dict["color_message"]
     return event_dict
 
 
+# Precompiled matcher for sensitive field names. A single case-insensitive
+# regex search runs in C, replacing a per-field lower() + 12-way substring
+# scan on every log record. "key" covers api_key/apikey/db_key; "auth"
+# covers authorization.
+_SENSITIVE_RE = re.compile(r"password|passwd|pwd|secret|token|auth|key|pepper", re.IGNORECASE)
+
+# Field names already checked and found benign (event, timestamp, level, ...).
+# Log field names are low-cardinality, so after warmup the common path is a
+# set lookup instead of a regex search. Bounded to guard against pathological
+# dynamic key names.
+_clean_keys: set[str] = set()
+_CLEAN_KEYS_MAX = 1024
+
+
 def censor_sensitive_data(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
     """
     Filter sensitive data from log messages.
@@ -46,27 +73,16 @@ def censor_sensitive_data(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
     - Secrets
     - Database keys
     """
-    sensitive_keys = {
-        "password",
-        "passwd",
-        "pwd",
-        "secret",
-        "token",
-        "api_key",
-        "apikey",
-        "auth",
-        "authorization",
-        "key",
-        "db_key",
-        "pepper",
-    }
-
     for key, value in event_dict.items():
+        if key in _clean_keys:
+            continue
         # Check if key contains sensitive terms
-        if any(sensitive in key.lower() for sensitive in sensitive_keys):
+        if _SENSITIVE_RE.search(key):
             if isinstance(value, str) and len(value) > 0:
                 # Show first 4 chars for debugging, rest as asterisks
                 event_dict[key] = f"{value[:4]}{'*' * (min(len(value) - 4, 8))}"
+        elif len(_clean_keys) < _CLEAN_KEYS_MAX:
+            _clean_keys.add(key)
 
     return event_dict
 
@@ -74,6 +90,19 @@ def censor_sensitive_data(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
 MAX_FIELD_LENGTH = 1024  # 1KB per field
 MAX_EXCEPTION_LENGTH = 2048  # 2KB for stack traces
 
+# Log directory, resolved once at import so configure_logging and
+# get_log_info agree on the location even if the cwd changes later.
+LOG_DIR = Path("./logs").resolve()
+
+# Settings.log_level values mapped to stdlib levels (no getattr reflection)
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 def truncate_long_values(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Truncate excessively long field values to keep log lines readable.
@@ -81,6 +110,14 @@ def truncate_long_values(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
     Caps individual field values to 1KB (2KB for exception/traceback fields).
     This prevents massive stack traces from creating 10KB+ log lines.
     """
+    # Aggregate guard: if all string content combined fits under the field
+    # cap, no individual field can need truncating — skip the keyed loop.
+    if (
+        sum(len(value) for value in event_dict.values() if isinstance(value, str))
+        <= MAX_FIELD_LENGTH
+    ):
+        return event_dict
+
     for key, value in event_dict.items():
         if not isinstance(value, str):
             continue
@@ -94,9 +131,19 @@ def truncate_long_values(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
     return event_dict
 
 
-_error_counts: dict[str, list[float]] = defaultdict(list)
+# Ring buffer of recent timestamps per error event. A bounded deque keeps
+# dedup O(1) per error log with fixed memory, instead of rebuilding a
+# growing timestamp list on every record during an error storm.
+_error_counts: dict[str, deque[float]] = defaultdict(
+    lambda: deque(maxlen=5)  # _ERROR_DEDUP_THRESHOLD
+)
 _ERROR_DEDUP_WINDOW = 30.0  # seconds
 _ERROR_DEDUP_THRESHOLD = 5  # suppress after this many repeats
+_ERROR_GC_INTERVAL = _ERROR_DEDUP_WINDOW * 10  # drop idle event keys
+_last_error_gc = 0.0
+# Structlog dispatches from whatever thread logged, so guard the
+# append/inspect sequence; with deques the critical section is a few ops.
+_error_lock = threading.Lock()
 
 
 def deduplicate_errors(_, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
@@ -105,31 +152,49 @@ def deduplicate_errors(_, method_name: str, event_dict: dict[str, Any]) -> dict[
     After 5 identical errors within 30 seconds, logs a summary and
     suppresses further duplicates until the window expires.
     """
+    global _last_error_gc
+
     if method_name not in ("error", "critical"):
         return event_dict
 
     event_name = event_dict.get("event", "")
     now = time.monotonic()
 
-    # Clean old entries outside the window
-    _error_counts[event_name] = [
-        t for t in _error_counts[event_name] if now - t < _ERROR_DEDUP_WINDOW
-    ]
+    with _error_lock:
+        # Periodically drop event names that haven't fired in a long time so
+        # the dict doesn't grow unbounded over the process lifetime.
+        if now - _last_error_gc > _ERROR_GC_INTERVAL:
+            _last_error_gc = now
+            for name in [
+                name
+                for name, stamps in _error_counts.items()
+                if not stamps or now - stamps[-1] > _ERROR_GC_INTERVAL
+            ]:
+                del _error_counts[name]
+
+        timestamps = _error_counts[event_name]
+        was_suppressing = (
+            len(timestamps) == _ERROR_DEDUP_THRESHOLD and now - timestamps[0] < _ERROR_DEDUP_WINDOW
+        )
+        timestamps.append(now)
 
-    _error_counts[event_name].append(now)
-    count = len(_error_counts[event_name])
+    if was_suppressing:
+        raise structlog.DropEvent
 
-    if count == _ERROR_DEDUP_THRESHOLD:
+    if len(timestamps) == _ERROR_DEDUP_THRESHOLD and now - timestamps[0] < _ERROR_DEDUP_WINDOW:
         event_dict["event"] = (
             f"{event_name} (suppressing further duplicates for {_ERROR_DEDUP_WINDOW:.0f}s)"
         )
-        return event_dict
-    elif count > _ERROR_DEDUP_THRESHOLD:
-        raise structlog.DropEvent
 
     return event_dict
 
 
+# Timestamp reused across a rotation burst (a sweep renames up to
+# backupCount+1 files in quick succession). Reusing the stamp keeps the
+# rotated files ordered consistently even across a second boundary.
+_last_rotation_stamp: tuple[float, str] | None = None
+
+
 def rotation_namer(default_name: str) -> str:
     """
     Custom namer for rotated log files using datetime stamps.
@@ -143,6 +208,8 @@ def rotation_namer(default_name: str) -> str:
     Returns:
         str: New filename with datetime stamp
     """
+    global _last_rotation_stamp
+
     # Extract directory, base name, and extension
     path = Path(default_name)
     dir_name = path.parent
@@ -151,8 +218,13 @@ def rotation_namer(default_name: str) -> str:
     name_parts = path.stem.split(".")
     base_name = name_parts[0]  # e.g., 'all' from 'all.log.1'
 
-    # Generate timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+    # Generate timestamp, debounced so all renames in one sweep share it
+    now = time.monotonic()
+    if _last_rotation_stamp is not None and now - _last_rotation_stamp[0] < 1.0:
+        timestamp = _last_rotation_stamp[1]
+    else:
+        timestamp = time.strftime("%Y-%m-%d_%H%M%S", time.localtime())
+        _last_rotation_stamp = (now, timestamp)
 
     # Create new filename: base-YYYY-MM-DD_HHMMSS.log
     new_name = f"{base_name}-{timestamp}.log"
@@ -160,18 +232,107 @@ def rotation_namer(default_name: str) -> str:
     return str(dir_name / new_name)
 
 
-def _create_file_handler(path: Path, level: int, fmt: str) -> logging.handlers.RotatingFileHandler:
-    """Create a rotating file handler with standard rotation settings."""
-    handler = logging.handlers.RotatingFileHandler(
-        path,
-        maxBytes=5 * 1024 * 1024,  # 5 MB
-        backupCount=3,
-        encoding="utf-8",
-    )
-    handler.namer = rotation_namer
-    handler.setLevel(level)
-    handler.setFormatter(logging.Formatter(fmt, datefmt="%Y-%m-%d %H:%M:%S"))
-    return handler
+# Listener thread draining queued records to the rotating file handlers.
+# Kept as a module global so reconfiguration and atexit can stop it.
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Stop the log queue listener thread, flushing pending records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records unformatted.
+
+    The default prepare() pre-renders the record to a string, which would
+    bypass the structlog ProcessorFormatter on the listener side. The
+    listener runs in-process, so records can cross the queue as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that amortizes the rotation size check.
+
+    The stdlib shouldRollover formats the record and calls stream.tell()
+    on every emit. With a 5 MB threshold and truncated fields, checking
+    every emit buys nothing, so the real check runs only every N records.
+    Worst-case overshoot is N * max record size, a small fraction of the
+    rotation threshold.
+    """
+
+    _CHECK_EVERY = 32
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._emits_since_check = self._CHECK_EVERY  # check on first emit
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:
+        self._emits_since_check += 1
+        if self._emits_since_check < self._CHECK_EVERY:
+            return 0
+        self._emits_since_check = 0
+        return super().shouldRollover(record)
+
+
+class _LazyFileHandler(logging.Handler):
+    """File handler that defers opening the log file until the first emit.
+
+    Processes that never log to disk before exiting (CLI entrypoints,
+    early startup failures) don't create the logs directory, open file
+    descriptors, or trigger rotation. Level and formatter set before the
+    first emit are carried over to the real handler.
+    """
+
+    def __init__(self, path: Path, level: int) -> None:
+        super().__init__(level)
+        self._path = path
+        self._real: logging.handlers.RotatingFileHandler | None = None
+
+    def _materialize(self) -> logging.handlers.RotatingFileHandler:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        handler = _BatchedRotatingFileHandler(
+            self._path,
+            maxBytes=5 * 1024 * 1024,  # 5 MB
+            backupCount=3,
+            encoding="utf-8",
+        )
+        handler.namer = rotation_namer
+        handler.setLevel(self.level)
+        if self.formatter is not None:
+            handler.setFormatter(self.formatter)
+        self._real = handler
+        return handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        real = self._real
+        if real is None:
+            real = self._materialize()
+        real.emit(record)
+
+    def close(self) -> None:
+        if self._real is not None:
+            self._real.close()
+            self._real = None
+        super().close()
+
+
+def _create_file_handler(path: Path, level: int) -> _LazyFileHandler:
+    """Create a lazily opened rotating file handler.
+
+    The structlog ProcessorFormatter is attached later in
+    configure_logging; no per-handler formatter is built here.
+    """
+    return _LazyFileHandler(path, level)
 
 
 def configure_logging() -> None:
@@ -198,13 +359,14 @@ def configure_logging() -> None:
     - ERROR: Errors that affect functionality
     - CRITICAL: Severe errors that may cause shutdown
     """
-    # Create logs directory
-    log_dir = Path("./logs")
-    log_dir.mkdir(exist_ok=True)
+    # Log directory creation is deferred to the first file write
+    # (_LazyFileHandler), so stdout-only runs never touch the filesystem.
+    log_dir = LOG_DIR
 
     # Determine log level from settings
-    log_level = getattr(logging, settings.log_level.upper())
-    is_debug = settings.log_level.upper() == "DEBUG"
+    level_name = settings.log_level.upper()
+    log_level = _LEVELS[level_name]
+    is_debug = level_name == "DEBUG"
     is_production = settings.environment == "production"
 
     # Configure standard library logging first
@@ -225,8 +387,10 @@ def configure_logging() -> None:
         drop_color_message_key,
     ]
 
-    # Setup handlers
-    handlers: list[logging.Handler] = []
+    # Setup handlers. File handlers are drained by a background listener
+    # thread so disk writes (and rotation) never block request threads;
+    # the console handler stays direct since container stdout is cheap.
+    file_handlers: list[logging.Handler] = []
 
     # 1. Console Handler - Always enabled
     console_handler = logging.StreamHandler(sys.stdout)
@@ -241,44 +405,37 @@ def configure_logging() -> None:
         )
 
     console_handler.setFormatter(console_formatter)
-    handlers.append(console_handler)
 
     # 2. All logs file handler (INFO+ by default, DEBUG+ if debug mode)
-    _standard_fmt = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-    handlers.append(
+    file_handlers.append(
         _create_file_handler(
             log_dir / "all.log",
             logging.DEBUG if is_debug else logging.INFO,
-            _standard_fmt,
         )
     )
 
     # 3. Error file handler (ERROR and CRITICAL only)
-    handlers.append(
-        _create_file_handler(
-            log_dir / "error.log",
-            logging.ERROR,
-            "%(asctime)s [%(levelname)s] %(name)s: %(message)s\n"
-            "%(pathname)s:%(lineno)d\n"
-            "%(message)s\n",
-        )
-    )
+    file_handlers.append(_create_file_handler(log_dir / "error.log", logging.ERROR))
 
     # 4. Debug file handler (only in debug mode)
     if is_debug:
-        handlers.append(
-            _create_file_handler(
-                log_dir / "debug.log",
-                logging.DEBUG,
-                "%(asctime)s [%(levelname)s] %(name)s:%(funcName)s:%(lineno)d\n%(message)s\n",
-            )
-        )
+        file_handlers.append(_create_file_handler(log_dir / "debug.log", logging.DEBUG))
+
+    # Route file writes through a queue drained by a single listener thread
+    global _queue_listener
+    _stop_queue_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = _PassthroughQueueHandler(log_queue)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *file_handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
 
     # Configure root logger
     logging.basicConfig(
         format="%(message)s",
         level=log_level,
-        handlers=handlers,
+        handlers=[console_handler, queue_handler],
     )
 
     # Configure structlog
@@ -301,14 +458,15 @@ def configure_logging() -> None:
         # Final rendering
         processors=[
             structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_serializer)
             if is_production
             else structlog.dev.ConsoleRenderer(),
         ],
     )
 
-    # Apply formatter to all handlers
-    for handler in handlers:
+    # Apply formatter to the real output handlers (the queue handler passes
+    # records through unformatted; the listener-side handlers render them)
+    for handler in [console_handler, *file_handlers]:
         handler.setFormatter(formatter)
 
     # Reduce noise from verbose libraries
@@ -324,7 +482,7 @@ def configure_logging() -> None:
         "logging_configured",
         log_level=settings.log_level,
         environment=settings.environment,
-        log_dir=str(log_dir.absolute()),
+        log_dir=str(log_dir),
         handlers={
             "console": True,
             "all_log": True,
@@ -350,12 +508,12 @@ def get_log_info() -> dict[str, Any]:
             - log_files: List of existing log files with sizes
             - total_size: Total size of all log files
     """
-    log_dir = Path("./logs")
+    log_dir = LOG_DIR
 
     if not log_dir.exists():
         return {
             "log_level": settings.log_level,
-            "log_dir": str(log_dir.absolute()),
+            "log_dir": str(log_dir),
             "log_files": [],
             "total_size": 0,
         }
@@ -363,20 +521,25 @@ def get_log_info() -> dict[str, Any]:
     log_files = []
     total_size = 0
 
-    for log_file in log_dir.glob("*.log*"):
-        size = log_file.stat().st_size
-        total_size += size
-        log_files.append(
-            {
-                "name": log_file.name,
-                "size_bytes": size,
-                "size_mb": round(size / (1024 * 1024), 2),
-            }
-        )
+    # os.scandir yields DirEntry objects with cached stat results — one
+    # syscall per file instead of the glob + explicit stat double-stat.
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if ".log" not in entry.name or not entry.is_file():
+                continue
+            size = entry.stat().st_size
+            total_size += size
+            log_files.append(
+                {
+                    "name": entry.name,
+                    "size_bytes": size,
+                    "size_mb": round(size / (1024 * 1024), 2),
+                }
+            )
 
     return {
         "log_level": settings.log_level,
-        "log_dir": str(log_dir.absolute()),
+        "log_dir": str(log_dir),
         "log_files": sorted(log_files, key=lambda x: x["name"]),
         "total_size_bytes": total_size,
         "total_size_mb": round(total_size / (1024 * 1024), 2),
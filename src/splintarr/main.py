@@ -205,6 +205,24 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         except Exception as e:
             logger.error("search_scheduler_stop_failed", error=str(e))
 
+        # Close pooled feedback clients
+        from splintarr.services.feedback import close_feedback_clients
+
+        try:
+            await close_feedback_clients()
+            logger.info("feedback_clients_closed")
+        except Exception as e:
+            logger.warning("feedback_clients_close_failed", error=str(e))
+
+        # Close shared HTTP connection pools
+        from splintarr.services.base_client import close_shared_http_pools
+
+        try:
+            await close_shared_http_pools()
+            logger.info("http_pools_closed")
+        except Exception as e:
+            logger.warning("http_pools_close_failed", error=str(e))
+
         # Close database connections
         close_db()
         logger.info("database_connections_closed")
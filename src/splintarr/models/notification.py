@@ -7,10 +7,12 @@ event subscriptions.
 """
 
 import json
+import types
 from typing import Any
 
+import orjson
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import reconstructor, relationship
 from sqlalchemy.sql import func
 
 from splintarr.database import Base
@@ -26,13 +28,19 @@ DEFAULT_EVENTS: dict[str, bool] = {
     "budget_alert": True,
 }
 
+# Precomputed forms of the defaults: the JSON string feeds the column
+# default, and the read-only proxy guards against accidental mutation of
+# the shared dict from get_events fallbacks.
+_DEFAULT_EVENTS_JSON: str = json.dumps(DEFAULT_EVENTS)
+_DEFAULT_EVENTS_FROZEN: types.MappingProxyType[str, bool] = types.MappingProxyType(DEFAULT_EVENTS)
+
 
 class NotificationConfig(Base):
     """
     NotificationConfig model for Discord webhook notification settings.
 
     Stores per-user notification preferences including:
-    - Fernet-encrypted Discord webhook URL
+    - Encrypted Discord webhook URL (AES-256-GCM; legacy rows are Fernet)
     - JSON-encoded event subscription flags
     - Active/inactive toggle
     - Timestamp tracking for rate limiting awareness
@@ -62,14 +70,14 @@ class NotificationConfig(Base):
     webhook_url = Column(
         Text,
         nullable=False,
-        comment="Fernet-encrypted Discord webhook URL",
+        comment="Encrypted Discord webhook URL (AES-GCM, legacy Fernet supported)",
     )
 
     # Event subscriptions (JSON string)
     events_enabled = Column(
         Text,
         nullable=False,
-        default=json.dumps(DEFAULT_EVENTS),
+        default=_DEFAULT_EVENTS_JSON,
         comment="JSON object mapping event names to enabled/disabled booleans",
     )
 
@@ -106,6 +114,15 @@ class NotificationConfig(Base):
     # Relationships
     user = relationship("User", back_populates="notification_config")
 
+    # Parsed events_enabled cache (plain instance attribute, not a mapped
+    # column) so repeated is_event_enabled checks don't re-parse the JSON.
+    # Fresh instances read it via getattr; the reconstructor resets it when
+    # an instance is loaded from the database.
+    @reconstructor
+    def _reset_events_cache(self) -> None:
+        """Invalidate the parsed events cache when loaded from the database."""
+        self._events_cache: dict[str, bool] | None = None
+
     def __repr__(self) -> str:
         """String representation of NotificationConfig."""
         return (
@@ -121,14 +138,21 @@ class NotificationConfig(Base):
             dict: Event names mapped to enabled/disabled booleans.
                   Returns defaults if parsing fails.
         """
+        cached: dict[str, bool] | None = getattr(self, "_events_cache", None)
+        if cached is not None:
+            return cached
+
         if not self.events_enabled:
-            return DEFAULT_EVENTS.copy()
+            events = dict(_DEFAULT_EVENTS_FROZEN)
+        else:
+            try:
+                parsed: dict[str, Any] = orjson.loads(self.events_enabled)
+                events = {k: bool(v) for k, v in parsed.items()}
+            except (orjson.JSONDecodeError, TypeError):
+                events = dict(_DEFAULT_EVENTS_FROZEN)
 
-        try:
-            events: dict[str, Any] = json.loads(self.events_enabled)
-            return {k: bool(v) for k, v in events.items()}
-        except (json.JSONDecodeError, TypeError):
-            return DEFAULT_EVENTS.copy()
+        self._events_cache = events
+        return events
 
     def set_events(self, events: dict[str, bool]) -> None:
         """
@@ -137,7 +161,9 @@ class NotificationConfig(Base):
         Args:
             events: Event names mapped to enabled/disabled booleans
         """
-        self.events_enabled = json.dumps(events)
+        # orjson emits bytes; the Text column needs str
+        self.events_enabled = orjson.dumps(events).decode()
+        self._events_cache = {k: bool(v) for k, v in events.items()}
 
     def is_event_enabled(self, event_name: str) -> bool:
         """
@@ -6,9 +6,9 @@ of all search operations performed.
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, Enum, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -122,11 +122,11 @@ class SearchHistory(Base):
         comment="Number of errors encountered during execution",
     )
 
-    # Additional metadata (JSON stored as text)
+    # Additional metadata (JSON column; list of per-item search log entries)
     search_metadata = Column(
-        Text,
+        JSON,
         nullable=True,
-        comment="JSON-encoded additional metadata (filters, API responses, etc.)",
+        comment="Additional metadata (per-item search log, filters, API responses, etc.)",
     )
 
     # Timestamps
@@ -198,7 +198,7 @@ class SearchHistory(Base):
         searches_triggered: int,
         errors_encountered: int = 0,
         error_message: str | None = None,
-        search_metadata: str | None = None,
+        search_metadata: list[dict[str, Any]] | None = None,
     ) -> None:
         """
         Mark the search as completed with results.
@@ -210,7 +210,7 @@ class SearchHistory(Base):
             searches_triggered: Number of searches triggered in the instance
             errors_encountered: Number of errors during execution (default: 0)
             error_message: Error message if failed (optional)
-            search_metadata: JSON-encoded per-item execution details (optional)
+            search_metadata: Per-item execution details (optional)
         """
         self._finalize()
         self.status = status
@@ -13,6 +13,7 @@ RadarrClient, including:
 """
 
 import asyncio
+import hashlib
 import time
 from typing import Any
 
@@ -66,6 +67,33 @@ class ArrRateLimitError(ArrClientError):
     pass
 
 
+# ---------------------------------------------------------------------------
+# Shared connection pool
+# ---------------------------------------------------------------------------
+
+# One httpx.AsyncClient per (url, api-key hash, verify_ssl, timeout). Clients
+# created per operation (search runs, library sync, feedback checks) borrow
+# from this pool, so repeated calls to the same instance reuse keep-alive
+# connections instead of paying TCP+TLS setup each time. The API key is
+# hashed so plaintext keys don't sit in dict keys.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=60.0,
+)
+_shared_pools: dict[tuple[str, str, bool, int], httpx.AsyncClient] = {}
+
+
+async def close_shared_http_pools() -> None:
+    """Close all pooled httpx clients. Called on application shutdown."""
+    for http_client in _shared_pools.values():
+        try:
+            await http_client.aclose()
+        except Exception as e:
+            logger.warning("http_pool_close_failed", error=str(e))
+    _shared_pools.clear()
+
+
 # ---------------------------------------------------------------------------
 # Base client
 # ---------------------------------------------------------------------------
@@ -168,25 +196,36 @@ class BaseArrClient:
     # -- Client lifecycle -------------------------------------------------------
 
     async def _ensure_client(self) -> None:
-        """Ensure HTTP client is initialized."""
+        """Ensure an HTTP client is attached, borrowing from the shared pool."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
-                verify=self.verify_ssl,
-                follow_redirects=False,  # Disabled: prevents X-Api-Key leaking to redirect targets
-                headers={
-                    "X-Api-Key": self.api_key,
-                    "User-Agent": f"{settings.app_name}/0.1.0",
-                },
-            )
-            logger.debug(f"{self.service_name}_http_client_created", url=self.url)
+            key_hash = hashlib.sha256(self.api_key.encode()).hexdigest()
+            pool_key = (self.url, key_hash, self.verify_ssl, self.timeout)
+            http_client = _shared_pools.get(pool_key)
+            if http_client is None or http_client.is_closed:
+                http_client = httpx.AsyncClient(
+                    timeout=httpx.Timeout(self.timeout),
+                    verify=self.verify_ssl,
+                    limits=_POOL_LIMITS,
+                    # Disabled: prevents X-Api-Key leaking to redirect targets
+                    follow_redirects=False,
+                    headers={
+                        "X-Api-Key": self.api_key,
+                        "User-Agent": f"{settings.app_name}/0.1.0",
+                    },
+                )
+                _shared_pools[pool_key] = http_client
+                logger.debug(f"{self.service_name}_http_client_created", url=self.url)
+            self._client = http_client
 
     async def close(self) -> None:
-        """Close HTTP client and release resources."""
+        """Detach from the shared HTTP client.
+
+        The underlying httpx client stays in the pool for reuse; it is only
+        closed by close_shared_http_pools() on application shutdown.
+        """
         if self._client is not None:
-            await self._client.aclose()
             self._client = None
-            logger.debug(f"{self.service_name}_http_client_closed", url=self.url)
+            logger.debug(f"{self.service_name}_http_client_detached", url=self.url)
 
     # -- Rate limiting ----------------------------------------------------------
 
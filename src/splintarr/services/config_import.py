@@ -4,7 +4,7 @@ from typing import Any
 import structlog
 
 from splintarr.config import settings
-from splintarr.core.security import encrypt_field
+from splintarr.core.security import encrypt_field, encrypt_webhook_url
 from splintarr.core.ssrf_protection import validate_instance_url
 from splintarr.models.exclusion import SearchExclusion
 from splintarr.models.instance import Instance
@@ -291,7 +291,7 @@ def apply_import(
             if not existing_notif:
                 notif = NotificationConfig(
                     user_id=user_id,
-                    webhook_url=encrypt_field(webhook_url),
+                    webhook_url=encrypt_webhook_url(webhook_url),
                     is_active=notif_data.get("is_active", True),
                 )
                 notif.set_events(notif_data.get("events_enabled", {}))
@@ -12,12 +12,17 @@ The service:
 5. Enriches search_metadata with grab_confirmed flags
 """
 
-import json
+import asyncio
+import time
+from collections import Counter
 from datetime import datetime
-from typing import Any
+from typing import Any, TypedDict, cast
 
+import orjson
 import structlog
+from sqlalchemy import update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
 
 from splintarr.core.security import decrypt_api_key
 from splintarr.models.instance import Instance
@@ -28,6 +33,65 @@ from splintarr.services.sonarr import SonarrClient
 
 logger = structlog.get_logger()
 
+# Metadata actions that carry a pollable search command
+_SEARCHABLE_ACTIONS = frozenset({"EpisodeSearch", "MoviesSearch"})
+
+# Long-lived clients keyed by instance id, reused across feedback runs so
+# periodic polling rides httpx's keep-alive pool instead of paying a fresh
+# TCP+TLS handshake each run. Each entry stores a config fingerprint
+# (client class, url, api key, verify_ssl, rate limit) so the client is
+# rebuilt whenever the instance configuration changes.
+_ClientFingerprint = tuple[type, str, str, bool, float]
+_client_cache: dict[int, tuple[_ClientFingerprint, "SonarrClient | RadarrClient"]] = {}
+
+# Command-status cache keyed by (instance_id, command_id). The same command
+# is often polled by several history records before it completes; terminal
+# states are immutable so they cache longer, transient ones only briefly to
+# coalesce near-simultaneous runs without serving stale confirmations.
+_TERMINAL_COMMAND_STATES = frozenset({"completed", "failed", "aborted"})
+_CMD_STATUS_TERMINAL_TTL = 45.0
+_CMD_STATUS_TRANSIENT_TTL = 5.0
+_CMD_STATUS_CACHE_MAX = 4096
+_cmd_status_cache: dict[tuple[int, int], tuple[float, dict[str, Any]]] = {}
+
+# Decrypted API keys keyed by instance id. Fernet decryption (HMAC + AES) is
+# otherwise repeated on every scheduled feedback check; the encrypted blob is
+# stored alongside the plaintext so an instance key rotation is a cache miss.
+_API_KEY_CACHE_MAX = 64
+_api_key_cache: dict[int, tuple[str, str]] = {}
+
+
+async def close_feedback_clients() -> None:
+    """Close all cached feedback clients. Called on application shutdown."""
+    for _, client in _client_cache.values():
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning("feedback_client_close_failed", error=str(e))
+    _client_cache.clear()
+
+
+class SearchLogEntry(TypedDict, total=False):
+    """Shape of one search_metadata entry written by the search queue.
+
+    Entries are plain dicts in the JSON column; this schema pins the known
+    keys so access stays typo-safe under mypy without any runtime cost.
+    """
+
+    item: str
+    action: str
+    reason: str
+    score: float
+    score_reason: str
+    item_id: int | None
+    series_id: int | None
+    season_number: int
+    command_id: int | None
+    command_issued_at: str
+    result: str
+    grab_confirmed: bool | None
+    source_title: str | None
+
 
 class FeedbackCheckService:
     """Check results of completed search runs for grab confirmation.
@@ -51,8 +115,8 @@ class FeedbackCheckService:
         Returns:
             dict with ``checked`` and ``grabs`` counts.
         """
-        # Load SearchHistory
-        history = self.db.query(SearchHistory).filter(SearchHistory.id == history_id).first()
+        # Load SearchHistory via the identity map (no query compile on repeat hits)
+        history = self.db.get(SearchHistory, history_id)
         if not history:
             logger.warning("feedback_check_no_history", history_id=history_id)
             return {"checked": 0, "grabs": 0}
@@ -62,12 +126,13 @@ class FeedbackCheckService:
         if entries is None:
             return {"checked": 0, "grabs": 0}
 
-        # Filter to entries that have a command_id and a searchable action
-        searchable_actions = {"EpisodeSearch", "MoviesSearch"}
+        # Filter to entries that have a command_id and a searchable action.
+        # The filtered list holds references into `entries`, so enrichment
+        # happens in place and no merge pass is needed at save time.
         commands = [
             e
             for e in entries
-            if e.get("action") in searchable_actions and e.get("command_id") is not None
+            if e.get("command_id") is not None and e.get("action") in _SEARCHABLE_ACTIONS
         ]
 
         if not commands:
@@ -79,7 +144,7 @@ class FeedbackCheckService:
             return {"checked": 0, "grabs": 0}
 
         # Load Instance
-        instance = self.db.query(Instance).filter(Instance.id == instance_id).first()
+        instance = self.db.get(Instance, instance_id)
         if not instance:
             logger.warning("feedback_check_no_instance", instance_id=instance_id)
             return {"checked": 0, "grabs": 0}
@@ -94,9 +159,8 @@ class FeedbackCheckService:
         is_sonarr = instance.instance_type == "sonarr"
         content_type = "series" if is_sonarr else "movie"
 
-        # Create typed client
         try:
-            api_key = decrypt_api_key(instance.api_key)
+            api_key = await self._decrypt_instance_api_key(instance)
         except Exception as e:
             logger.error(
                 "feedback_check_client_failed",
@@ -105,47 +169,59 @@ class FeedbackCheckService:
             )
             return {"checked": 0, "grabs": 0}
 
-        client_cls = SonarrClient if is_sonarr else RadarrClient
         checked = 0
         grabs = 0
 
         try:
-            async with client_cls(
-                url=instance.url,
-                api_key=api_key,
-                verify_ssl=instance.verify_ssl,
-                rate_limit_per_second=instance.rate_limit_per_second or 5,
-            ) as client:
-                for entry in commands:
-                    command_id = entry["command_id"]
-                    try:
-                        grab_confirmed = await self._check_single_command(
-                            client=client,
-                            entry=entry,
-                            is_sonarr=is_sonarr,
-                        )
-                        entry["grab_confirmed"] = grab_confirmed
-                        # Update result from "sent" to "grabbed"/"no grab"
-                        if entry.get("result") == "sent":
-                            entry["result"] = "grabbed" if grab_confirmed else "no grab"
-                        checked += 1
-
-                        if grab_confirmed:
-                            grabs += 1
-                            # Update LibraryItem
-                            self._record_grab_on_library_item(
-                                instance_id=instance_id,
-                                content_type=content_type,
-                                entry=entry,
-                            )
-                    except Exception as e:
-                        logger.warning(
-                            "feedback_check_command_failed",
-                            command_id=command_id,
-                            error=str(e),
-                        )
-                        entry["grab_confirmed"] = None  # unknown
-                        checked += 1
+            # Reuse the pooled client for this instance; no per-run handshake.
+            client = await self._get_client(instance, api_key, is_sonarr)
+
+            # Check commands concurrently; the semaphore keeps in-flight
+            # requests within the instance's per-second rate budget.
+            semaphore = asyncio.Semaphore(instance.rate_limit_per_second or 5)
+
+            async def check_with_limit(entry: SearchLogEntry) -> bool:
+                async with semaphore:
+                    return await self._check_single_command(
+                        client=client,
+                        entry=entry,
+                        is_sonarr=is_sonarr,
+                        instance_id=instance_id,
+                    )
+
+            results = await asyncio.gather(
+                *(check_with_limit(e) for e in commands),
+                return_exceptions=True,
+            )
+
+            confirmed_entries: list[SearchLogEntry] = []
+            for entry, result in zip(commands, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.warning(
+                        "feedback_check_command_failed",
+                        command_id=entry["command_id"],
+                        error=str(result),
+                    )
+                    entry["grab_confirmed"] = None  # unknown
+                    checked += 1
+                    continue
+
+                entry["grab_confirmed"] = result
+                # Update result from "sent" to "grabbed"/"no grab"
+                if entry.get("result") == "sent":
+                    entry["result"] = "grabbed" if result else "no grab"
+                checked += 1
+
+                if result:
+                    grabs += 1
+                    confirmed_entries.append(entry)
+
+            # Update LibraryItems for all confirmed grabs in one query
+            self._record_grabs_on_library_items(
+                instance_id=instance_id,
+                content_type=content_type,
+                entries=confirmed_entries,
+            )
 
         except Exception as e:
             logger.error(
@@ -173,45 +249,144 @@ class FeedbackCheckService:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _parse_metadata(self, history: SearchHistory) -> list[dict[str, Any]] | None:
+    async def _decrypt_instance_api_key(self, instance: Instance) -> str:
+        """Return the instance's plaintext API key, memoized across runs.
+
+        Decryption is synchronous CPU work, so cache misses run it off the
+        event loop via a thread.
+        """
+        cached = _api_key_cache.get(instance.id)
+        if cached is not None and cached[0] == instance.api_key:
+            return cached[1]
+
+        api_key = await asyncio.to_thread(decrypt_api_key, instance.api_key)
+        if len(_api_key_cache) >= _API_KEY_CACHE_MAX:
+            _api_key_cache.clear()
+        _api_key_cache[instance.id] = (instance.api_key, api_key)
+        return api_key
+
+    async def _get_client(
+        self,
+        instance: Instance,
+        api_key: str,
+        is_sonarr: bool,
+    ) -> SonarrClient | RadarrClient:
+        """Return the pooled client for an instance, creating it on first use.
+
+        The cached client is rebuilt (and the old one closed) when the
+        instance configuration no longer matches its fingerprint.
+        """
+        client_cls = SonarrClient if is_sonarr else RadarrClient
+        rate_limit = instance.rate_limit_per_second or 5
+        fingerprint: _ClientFingerprint = (
+            client_cls,
+            instance.url,
+            api_key,
+            instance.verify_ssl,
+            rate_limit,
+        )
+
+        cached = _client_cache.get(instance.id)
+        if cached is not None:
+            if cached[0] == fingerprint:
+                return cached[1]
+            # Instance config changed — retire the stale client
+            try:
+                await cached[1].close()
+            except Exception as e:
+                logger.warning(
+                    "feedback_client_close_failed",
+                    instance_id=instance.id,
+                    error=str(e),
+                )
+
+        client = client_cls(
+            url=instance.url,
+            api_key=api_key,
+            verify_ssl=instance.verify_ssl,
+            rate_limit_per_second=rate_limit,
+        )
+        _client_cache[instance.id] = (fingerprint, client)
+        logger.debug(
+            "feedback_client_created",
+            instance_id=instance.id,
+            service=client_cls.service_name,
+        )
+        return client
+
+    def _parse_metadata(self, history: SearchHistory) -> list[SearchLogEntry] | None:
         """Parse search_metadata JSON from a SearchHistory record.
 
         Returns None (with a warning log) if the metadata is missing or invalid.
         """
-        if not history.search_metadata:
+        data = history.search_metadata
+        if not data:
             logger.debug(
                 "feedback_check_empty_metadata",
                 history_id=history.id,
             )
             return None
 
-        try:
-            data = json.loads(history.search_metadata)
-            if not isinstance(data, list):
+        # Legacy rows persisted the log as a JSON string inside the column
+        if isinstance(data, str):
+            try:
+                data = orjson.loads(data)
+            except orjson.JSONDecodeError:
                 logger.warning(
                     "feedback_check_invalid_metadata",
                     history_id=history.id,
                 )
                 return None
-            return data
-        except (json.JSONDecodeError, TypeError):
+
+        if not isinstance(data, list):
             logger.warning(
                 "feedback_check_invalid_metadata",
                 history_id=history.id,
             )
             return None
+        return cast(list[SearchLogEntry], data)
+
+    async def _get_command_status(
+        self,
+        client: SonarrClient | RadarrClient,
+        instance_id: int,
+        command_id: int,
+    ) -> dict[str, Any]:
+        """Fetch a command's status through the short-TTL cache."""
+        key = (instance_id, command_id)
+        now = time.monotonic()
+        cached = _cmd_status_cache.get(key)
+        if cached is not None and now < cached[0]:
+            logger.debug(
+                "feedback_command_status_cache_hit",
+                instance_id=instance_id,
+                command_id=command_id,
+            )
+            return cached[1]
+
+        status = await client.get_command_status(command_id)
+        ttl = (
+            _CMD_STATUS_TERMINAL_TTL
+            if status.get("status") in _TERMINAL_COMMAND_STATES
+            else _CMD_STATUS_TRANSIENT_TTL
+        )
+        if len(_cmd_status_cache) >= _CMD_STATUS_CACHE_MAX:
+            _cmd_status_cache.clear()  # cheap reset; repopulates on demand
+        _cmd_status_cache[key] = (now + ttl, status)
+        return status
 
     async def _check_single_command(
         self,
         client: SonarrClient | RadarrClient,
-        entry: dict[str, Any],
+        entry: SearchLogEntry,
         is_sonarr: bool,
+        instance_id: int,
     ) -> bool:
         """Check a single command and return whether a grab was confirmed."""
         command_id = entry["command_id"]
 
         # Check command completion
-        status = await client.get_command_status(command_id)
+        status = await self._get_command_status(client, instance_id, command_id)
         if status.get("status") != "completed":
             return False
 
@@ -224,7 +399,7 @@ class FeedbackCheckService:
     async def _check_sonarr_episode(
         self,
         client: SonarrClient,
-        entry: dict[str, Any],
+        entry: SearchLogEntry,
     ) -> bool:
         """Check if a Sonarr episode was grabbed after our search command.
 
@@ -239,15 +414,13 @@ class FeedbackCheckService:
 
         command_issued_at = entry.get("command_issued_at")
 
-        # Fallback for old metadata without timestamp: use legacy hasFile check
+        # Fallback for old metadata without timestamp: use legacy hasFile check.
+        # Fetch the one episode directly instead of scanning the full series.
         if not command_issued_at:
             if not series_id:
                 return False
-            episodes = await client.get_episodes(series_id)
-            for ep in episodes:
-                if ep.get("id") == item_id and ep.get("hasFile") is True:
-                    return True
-            return False
+            episode = await client.get_episode(item_id)
+            return episode.get("hasFile") is True
 
         # Use history API: find grabbed events after our command
         try:
@@ -285,7 +458,7 @@ class FeedbackCheckService:
     async def _check_radarr_movie(
         self,
         client: RadarrClient,
-        entry: dict[str, Any],
+        entry: SearchLogEntry,
     ) -> bool:
         """Check if a Radarr movie now has a file."""
         item_id = entry.get("item_id")
@@ -295,46 +468,73 @@ class FeedbackCheckService:
         movie = await client.get_movies(item_id)
         return isinstance(movie, dict) and movie.get("hasFile") is True
 
-    def _record_grab_on_library_item(
+    def _record_grabs_on_library_items(
         self,
         instance_id: int,
         content_type: str,
-        entry: dict[str, Any],
+        entries: list[SearchLogEntry],
     ) -> None:
-        """Update LibraryItem.record_grab() for a confirmed grab."""
-        # Determine the external_id (series_id for Sonarr, item_id for Radarr)
-        if content_type == "series":
-            external_id = entry.get("series_id")
-        else:
-            external_id = entry.get("item_id")
+        """Record all confirmed grabs on the affected LibraryItems.
 
-        if not external_id:
+        Loads every affected LibraryItem in a single query (titles feed the
+        per-item log lines), then applies all counter increments with one
+        bulk UPDATE by primary key instead of per-item record_grab() calls;
+        a series grabbed for several episodes still gets its full increment.
+        """
+        # Determine the external_id (series_id for Sonarr, item_id for Radarr)
+        id_key = "series_id" if content_type == "series" else "item_id"
+        grab_counts = Counter(
+            external_id for entry in entries if (external_id := entry.get(id_key))
+        )
+        if not grab_counts:
             return
 
-        library_item = (
+        library_items = (
             self.db.query(LibraryItem)
             .filter(
                 LibraryItem.instance_id == instance_id,
-                LibraryItem.external_id == external_id,
+                LibraryItem.external_id.in_(grab_counts),
                 LibraryItem.content_type == content_type,
             )
-            .first()
+            .all()
         )
 
-        if library_item:
-            library_item.record_grab()
+        if not library_items:
+            return
+
+        now = datetime.utcnow()
+        self.db.execute(
+            update(LibraryItem),
+            [
+                {
+                    "id": library_item.id,
+                    "grabs_confirmed": (library_item.grabs_confirmed or 0)
+                    + grab_counts[library_item.external_id],
+                    "last_grab_at": now,
+                }
+                for library_item in library_items
+            ],
+        )
+
+        for library_item in library_items:
             logger.info(
                 "feedback_grab_confirmed",
                 instance_id=instance_id,
-                external_id=external_id,
+                external_id=library_item.external_id,
                 content_type=content_type,
                 title=library_item.title,
             )
 
-    def _save_metadata(self, history: SearchHistory, entries: list[dict[str, Any]]) -> None:
-        """Re-serialize enriched entries back to search_metadata and commit."""
+    def _save_metadata(self, history: SearchHistory, entries: list[SearchLogEntry]) -> None:
+        """Store enriched entries back on search_metadata and commit.
+
+        Enrichment mutates the entry dicts in place, so when the column
+        already held a list the ORM sees no net change; flag_modified forces
+        the UPDATE regardless.
+        """
         try:
-            history.search_metadata = json.dumps(entries)
+            history.search_metadata = entries
+            flag_modified(history, "search_metadata")
             self.db.commit()
         except Exception as e:
             self.db.rollback()
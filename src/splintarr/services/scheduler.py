@@ -525,7 +525,7 @@ class SearchScheduler:
     ) -> None:
         """Send Discord notification for grab confirmation results."""
         try:
-            from splintarr.core.security import decrypt_field
+            from splintarr.core.security import decrypt_webhook_url
             from splintarr.models.notification import NotificationConfig
             from splintarr.services.discord import DiscordNotificationService
 
@@ -547,7 +547,7 @@ class SearchScheduler:
             search_name = history.search_name if history else f"Search #{history_id}"
             instance_name = instance.name if instance else f"Instance #{instance_id}"
 
-            webhook_url = decrypt_field(config.webhook_url)
+            webhook_url = decrypt_webhook_url(config.webhook_url)
             discord = DiscordNotificationService(webhook_url)
             await discord.send_grab_confirmed(
                 search_name=search_name,
@@ -561,7 +561,7 @@ class SearchScheduler:
     async def _notify_health_change(self, db: Session, result: dict) -> None:
         """Send Discord notification for health status change."""
         try:
-            from splintarr.core.security import decrypt_field
+            from splintarr.core.security import decrypt_webhook_url
             from splintarr.models.notification import NotificationConfig
             from splintarr.services.discord import DiscordNotificationService
 
@@ -576,7 +576,7 @@ class SearchScheduler:
             if not config or not config.is_event_enabled("instance_health"):
                 return
 
-            webhook_url = decrypt_field(config.webhook_url)
+            webhook_url = decrypt_webhook_url(config.webhook_url)
             discord = DiscordNotificationService(webhook_url)
 
             await discord.send_instance_health(
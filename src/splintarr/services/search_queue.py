@@ -25,7 +25,7 @@ from sqlalchemy.orm import Session
 
 from splintarr.config import settings
 from splintarr.core.events import event_bus
-from splintarr.core.security import decrypt_api_key, decrypt_field
+from splintarr.core.security import decrypt_api_key, decrypt_webhook_url
 from splintarr.models import Instance, NotificationConfig, SearchHistory, SearchQueue
 from splintarr.services.cooldown import is_in_cooldown
 from splintarr.services.custom_filters import apply_custom_filters
@@ -281,9 +281,8 @@ class SearchQueueManager:
                     items_searched=result["items_searched"],
                 )
 
-                # Serialize per-item search log into metadata
+                # Per-item search log goes straight into the JSON column
                 search_log = result.get("search_log", [])
-                metadata_json = json.dumps(search_log) if search_log else None
 
                 history.mark_completed(
                     status=result["status"],
@@ -291,7 +290,7 @@ class SearchQueueManager:
                     items_found=result["items_found"],
                     searches_triggered=result["searches_triggered"],
                     errors_encountered=len(result.get("errors", [])),
-                    search_metadata=metadata_json,
+                    search_metadata=search_log or None,
                 )
 
                 db.commit()
@@ -1438,7 +1437,7 @@ class SearchQueueManager:
             if not config or not config.is_event_enabled("search_triggered"):
                 return
 
-            webhook_url = decrypt_field(config.webhook_url)
+            webhook_url = decrypt_webhook_url(config.webhook_url)
             service = DiscordNotificationService(webhook_url)
             await service.send_search_summary(
                 search_name=search_name,
@@ -1478,7 +1477,7 @@ class SearchQueueManager:
             if not config or not config.is_event_enabled("queue_failed"):
                 return
 
-            webhook_url = decrypt_field(config.webhook_url)
+            webhook_url = decrypt_webhook_url(config.webhook_url)
             service = DiscordNotificationService(webhook_url)
             await service.send_queue_failed(
                 queue_name=queue_name,
@@ -1516,7 +1515,7 @@ class SearchQueueManager:
             if not config or not config.is_event_enabled("search_triggered"):
                 return
 
-            webhook_url = decrypt_field(config.webhook_url)
+            webhook_url = decrypt_webhook_url(config.webhook_url)
             service = DiscordNotificationService(webhook_url)
             await service.send_search_started(
                 search_name=search_name,
@@ -247,6 +247,28 @@ class SonarrClient(BaseArrClient):
         )
         return episodes
 
+    async def get_episode(self, episode_id: int) -> dict[str, Any]:
+        """
+        Get a single episode by its ID.
+
+        Args:
+            episode_id: Episode ID to fetch
+
+        Returns:
+            dict: Episode record
+
+        Raises:
+            SonarrError: If request fails
+        """
+        result = await self._request("GET", f"/api/v3/episode/{episode_id}")
+        episode = result if isinstance(result, dict) else {}
+        logger.debug(
+            "sonarr_episode_retrieved",
+            url=self.url,
+            episode_id=episode_id,
+        )
+        return episode
+
     async def get_poster_bytes(self, series_id: int) -> bytes | None:
         """
         Download poster image for a series.
@@ -122,7 +122,7 @@ async def _notify_update_available(
 ) -> None:
     """Send Discord notification for available update if configured."""
     try:
-        from splintarr.core.security import decrypt_field
+        from splintarr.core.security import decrypt_webhook_url
         from splintarr.database import get_session_factory
         from splintarr.models.notification import NotificationConfig
         from splintarr.services.discord import DiscordNotificationService
@@ -137,7 +137,7 @@ async def _notify_update_available(
             if not config or not config.is_event_enabled("update_available"):
                 return
 
-            webhook_url = decrypt_field(config.webhook_url)
+            webhook_url = decrypt_webhook_url(config.webhook_url)
             service = DiscordNotificationService(webhook_url)
             await service.send_update_available(
                 current_version=current_version,
@@ -14,7 +14,7 @@ import secrets
 import tempfile
 from pathlib import Path
 from typing import Generator
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -85,6 +85,52 @@ def db_session(db_engine) -> Generator[Session, None, None]:
     session.close()
 
 
+@pytest.fixture(autouse=True)
+def _clear_module_caches() -> Generator[None, None, None]:
+    """Reset module-level caches between tests.
+
+    The feedback service and the arr clients keep process-wide caches
+    (pooled HTTP clients, command statuses, decrypted API keys) that
+    outlive the per-test in-memory database, while instance and command
+    ids restart at 1 in every test — a stale entry keyed on a recycled id
+    would bleed one test's state into the next.
+    """
+    yield
+    from splintarr.services import base_client, feedback
+
+    feedback._client_cache.clear()
+    feedback._cmd_status_cache.clear()
+    feedback._api_key_cache.clear()
+    base_client._shared_pools.clear()
+
+
+def _mock_feedback_client(monkeypatch: pytest.MonkeyPatch, client_attr: str) -> AsyncMock:
+    """Patch feedback's arr client class and API-key decryption with mocks."""
+    mock_client = AsyncMock()
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=False)
+    mock_cls = MagicMock(return_value=mock_client)
+    monkeypatch.setattr(f"splintarr.services.feedback.{client_attr}", mock_cls)
+    monkeypatch.setattr("splintarr.services.feedback.decrypt_api_key", lambda _key: "a" * 32)
+    return mock_client
+
+
+@pytest.fixture
+def mock_sonarr_client(monkeypatch) -> AsyncMock:
+    """AsyncMock standing in for SonarrClient in the feedback service.
+
+    Tests set return values (get_command_status, get_episode, ...) on the
+    yielded mock instead of rebuilding the patch scaffolding per test.
+    """
+    return _mock_feedback_client(monkeypatch, "SonarrClient")
+
+
+@pytest.fixture
+def mock_radarr_client(monkeypatch) -> AsyncMock:
+    """AsyncMock standing in for RadarrClient in the feedback service."""
+    return _mock_feedback_client(monkeypatch, "RadarrClient")
+
+
 @pytest.fixture
 def temp_secrets_dir():
     """Create temporary directory for secret files."""
@@ -6,14 +6,15 @@ statuses to detect whether content was actually grabbed.
 """
 
 import json
+from dataclasses import dataclass
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
 
-import pytest
 
 from splintarr.models.instance import Instance
 from splintarr.models.library import LibraryItem
 from splintarr.models.search_history import SearchHistory
+from splintarr.models.user import User
 from splintarr.services.feedback import FeedbackCheckService
 
 
@@ -22,39 +23,37 @@ from splintarr.services.feedback import FeedbackCheckService
 # ---------------------------------------------------------------------------
 
 
-def _make_history(
-    db,
-    instance_id: int = 1,
-    search_metadata: str | None = None,
-) -> SearchHistory:
-    """Create and persist a SearchHistory record."""
-    history = SearchHistory(
-        instance_id=instance_id,
-        search_queue_id=None,
-        search_name="Test Search",
-        strategy="missing",
-        started_at=datetime.utcnow(),
-        status="success",
-        items_searched=1,
-        items_found=1,
-        searches_triggered=1,
-        errors_encountered=0,
-        search_metadata=search_metadata,
-    )
-    db.add(history)
-    db.commit()
-    db.refresh(history)
-    return history
+@dataclass
+class _Fixture:
+    """ORM objects persisted by _setup for one test."""
+
+    user_id: int
+    instance: Instance
+    history: SearchHistory
+    lib_item: LibraryItem | None = None
 
 
-def _make_instance(
+def _setup(
     db,
+    *,
     instance_type: str = "sonarr",
-    user_id: int = 1,
-) -> Instance:
-    """Create and persist an Instance record."""
+    metadata: Any = None,
+    library_item: dict[str, Any] | None = None,
+) -> _Fixture:
+    """Persist the user/instance/(library item)/history graph in one commit.
+
+    Rows are flushed in dependency order so foreign keys resolve, but only
+    committed once — a single fsync per test instead of one per row.
+    """
+    user = User(
+        username="testuser",
+        password_hash="$argon2id$v=19$m=65536,t=3,p=4$fakesaltfakesalt$fakehashfakehash",
+    )
+    db.add(user)
+    db.flush()
+
     inst = Instance(
-        user_id=user_id,
+        user_id=user.id,
         name="Test Instance",
         instance_type=instance_type,
         url="http://localhost:8989",
@@ -62,45 +61,33 @@ def _make_instance(
         is_active=True,
     )
     db.add(inst)
-    db.commit()
-    db.refresh(inst)
-    return inst
-
-
-def _make_library_item(
-    db,
-    instance_id: int,
-    external_id: int,
-    content_type: str = "series",
-    title: str = "Test Series",
-) -> LibraryItem:
-    """Create and persist a LibraryItem record."""
-    item = LibraryItem(
-        instance_id=instance_id,
-        content_type=content_type,
-        external_id=external_id,
-        title=title,
-        episode_count=10,
-        episode_have=5,
-    )
-    db.add(item)
-    db.commit()
-    db.refresh(item)
-    return item
+    db.flush()
 
+    lib_item = None
+    if library_item is not None:
+        lib_item = LibraryItem(
+            instance_id=inst.id,
+            episode_count=10,
+            episode_have=5,
+            **library_item,
+        )
 
-def _make_user(db) -> int:
-    """Create a minimal user and return its id."""
-    from splintarr.models.user import User
-
-    user = User(
-        username="testuser",
-        password_hash="$argon2id$v=19$m=65536,t=3,p=4$fakesaltfakesalt$fakehashfakehash",
+    history = SearchHistory(
+        instance_id=inst.id,
+        search_queue_id=None,
+        search_name="Test Search",
+        strategy="missing",
+        started_at=datetime.utcnow(),
+        status="success",
+        items_searched=1,
+        items_found=1,
+        searches_triggered=1,
+        errors_encountered=0,
+        search_metadata=metadata,
     )
-    db.add(user)
+    db.add_all([lib_item, history] if lib_item is not None else [history])
     db.commit()
-    db.refresh(user)
-    return user.id
+    return _Fixture(user_id=user.id, instance=inst, history=history, lib_item=lib_item)
 
 
 # ---------------------------------------------------------------------------
@@ -108,7 +95,6 @@ def _make_user(db) -> int:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_no_history_record(db_session):
     """Missing history record returns {checked: 0, grabs: 0}."""
     service = FeedbackCheckService(db_session)
@@ -121,21 +107,18 @@ async def test_no_history_record(db_session):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_no_searchable_commands(db_session):
     """Metadata with only skipped entries returns {checked: 0, grabs: 0}."""
-    user_id = _make_user(db_session)
-    instance = _make_instance(db_session, user_id=user_id)
-    metadata = json.dumps(
-        [
-            {"item": "Some Show S01E01", "action": "skipped", "reason": "cooldown"},
-            {"item": "Some Show S01E02", "action": "skipped", "reason": "excluded"},
-        ]
-    )
-    history = _make_history(db_session, instance_id=instance.id, search_metadata=metadata)
+    metadata = [
+        {"item": "Some Show S01E01", "action": "skipped", "reason": "cooldown"},
+        {"item": "Some Show S01E02", "action": "skipped", "reason": "excluded"},
+    ]
+    f = _setup(db_session, metadata=metadata)
 
     service = FeedbackCheckService(db_session)
-    result = await service.check_search_results(history_id=history.id, instance_id=instance.id)
+    result = await service.check_search_results(
+        history_id=f.history.id, instance_id=f.instance.id
+    )
     assert result == {"checked": 0, "grabs": 0}
 
 
@@ -144,61 +127,44 @@ async def test_no_searchable_commands(db_session):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_sonarr_grab_confirmed(db_session):
+async def test_sonarr_grab_confirmed(db_session, mock_sonarr_client):
     """Completed Sonarr command with hasFile=True records a grab."""
-    user_id = _make_user(db_session)
-    instance = _make_instance(db_session, instance_type="sonarr", user_id=user_id)
-    lib_item = _make_library_item(
+    metadata = [
+        {
+            "item": "Breaking Bad S01E01",
+            "action": "EpisodeSearch",
+            "item_id": 123,
+            "series_id": 42,
+            "command_id": 555,
+            "result": "sent",
+        },
+    ]
+    f = _setup(
         db_session,
-        instance_id=instance.id,
-        external_id=42,
-        content_type="series",
-        title="Breaking Bad",
+        instance_type="sonarr",
+        metadata=metadata,
+        library_item={"external_id": 42, "content_type": "series", "title": "Breaking Bad"},
     )
-    assert lib_item.grabs_confirmed == 0
-
-    metadata = json.dumps(
-        [
-            {
-                "item": "Breaking Bad S01E01",
-                "action": "EpisodeSearch",
-                "item_id": 123,
-                "series_id": 42,
-                "command_id": 555,
-                "result": "sent",
-            },
-        ]
+    assert f.lib_item.grabs_confirmed == 0
+
+    mock_sonarr_client.get_command_status.return_value = {"status": "completed"}
+    mock_sonarr_client.get_episode.return_value = {"id": 123, "hasFile": True}
+
+    service = FeedbackCheckService(db_session)
+    result = await service.check_search_results(
+        history_id=f.history.id, instance_id=f.instance.id
     )
-    history = _make_history(db_session, instance_id=instance.id, search_metadata=metadata)
-
-    with patch("splintarr.services.feedback.decrypt_api_key", return_value="a" * 32):
-        with patch("splintarr.services.feedback.SonarrClient") as MockClient:
-            mock_client = AsyncMock()
-            mock_client.get_command_status.return_value = {"status": "completed"}
-            mock_client.get_episodes.return_value = [
-                {"id": 123, "hasFile": True},
-                {"id": 124, "hasFile": False},
-            ]
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            MockClient.return_value = mock_client
-
-            service = FeedbackCheckService(db_session)
-            result = await service.check_search_results(
-                history_id=history.id, instance_id=instance.id
-            )
 
     assert result == {"checked": 1, "grabs": 1}
 
     # LibraryItem should have been updated
-    db_session.refresh(lib_item)
-    assert lib_item.grabs_confirmed == 1
-    assert lib_item.last_grab_at is not None
+    db_session.refresh(f.lib_item)
+    assert f.lib_item.grabs_confirmed == 1
+    assert f.lib_item.last_grab_at is not None
 
     # Metadata should be enriched
-    db_session.refresh(history)
-    enriched = json.loads(history.search_metadata)
+    db_session.refresh(f.history)
+    enriched = f.history.search_metadata
     assert enriched[0]["grab_confirmed"] is True
 
 
@@ -207,46 +173,32 @@ async def test_sonarr_grab_confirmed(db_session):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_sonarr_no_grab(db_session):
+async def test_sonarr_no_grab(db_session, mock_sonarr_client):
     """Completed command but episode still missing -> grab_confirmed=False."""
-    user_id = _make_user(db_session)
-    instance = _make_instance(db_session, instance_type="sonarr", user_id=user_id)
-
-    metadata = json.dumps(
-        [
-            {
-                "item": "Lost S02E03",
-                "action": "EpisodeSearch",
-                "item_id": 200,
-                "series_id": 10,
-                "command_id": 600,
-                "result": "sent",
-            },
-        ]
+    metadata = [
+        {
+            "item": "Lost S02E03",
+            "action": "EpisodeSearch",
+            "item_id": 200,
+            "series_id": 10,
+            "command_id": 600,
+            "result": "sent",
+        },
+    ]
+    f = _setup(db_session, instance_type="sonarr", metadata=metadata)
+
+    mock_sonarr_client.get_command_status.return_value = {"status": "completed"}
+    mock_sonarr_client.get_episode.return_value = {"id": 200, "hasFile": False}
+
+    service = FeedbackCheckService(db_session)
+    result = await service.check_search_results(
+        history_id=f.history.id, instance_id=f.instance.id
     )
-    history = _make_history(db_session, instance_id=instance.id, search_metadata=metadata)
-
-    with patch("splintarr.services.feedback.decrypt_api_key", return_value="a" * 32):
-        with patch("splintarr.services.feedback.SonarrClient") as MockClient:
-            mock_client = AsyncMock()
-            mock_client.get_command_status.return_value = {"status": "completed"}
-            mock_client.get_episodes.return_value = [
-                {"id": 200, "hasFile": False},
-            ]
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            MockClient.return_value = mock_client
-
-            service = FeedbackCheckService(db_session)
-            result = await service.check_search_results(
-                history_id=history.id, instance_id=instance.id
-            )
 
     assert result == {"checked": 1, "grabs": 0}
 
-    db_session.refresh(history)
-    enriched = json.loads(history.search_metadata)
+    db_session.refresh(f.history)
+    enriched = f.history.search_metadata
     assert enriched[0]["grab_confirmed"] is False
 
 
@@ -255,43 +207,31 @@ async def test_sonarr_no_grab(db_session):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_command_not_completed(db_session):
+async def test_command_not_completed(db_session, mock_sonarr_client):
     """Command still queued/running -> grab_confirmed=False."""
-    user_id = _make_user(db_session)
-    instance = _make_instance(db_session, instance_type="sonarr", user_id=user_id)
-
-    metadata = json.dumps(
-        [
-            {
-                "item": "Dexter S01E01",
-                "action": "EpisodeSearch",
-                "item_id": 300,
-                "series_id": 20,
-                "command_id": 700,
-                "result": "sent",
-            },
-        ]
-    )
-    history = _make_history(db_session, instance_id=instance.id, search_metadata=metadata)
-
-    with patch("splintarr.services.feedback.decrypt_api_key", return_value="a" * 32):
-        with patch("splintarr.services.feedback.SonarrClient") as MockClient:
-            mock_client = AsyncMock()
-            mock_client.get_command_status.return_value = {"status": "queued"}
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            MockClient.return_value = mock_client
+    metadata = [
+        {
+            "item": "Dexter S01E01",
+            "action": "EpisodeSearch",
+            "item_id": 300,
+            "series_id": 20,
+            "command_id": 700,
+            "result": "sent",
+        },
+    ]
+    f = _setup(db_session, instance_type="sonarr", metadata=metadata)
+
+    mock_sonarr_client.get_command_status.return_value = {"status": "queued"}
 
-            service = FeedbackCheckService(db_session)
-            result = await service.check_search_results(
-                history_id=history.id, instance_id=instance.id
-            )
+    service = FeedbackCheckService(db_session)
+    result = await service.check_search_results(
+        history_id=f.history.id, instance_id=f.instance.id
+    )
 
     assert result == {"checked": 1, "grabs": 0}
 
-    db_session.refresh(history)
-    enriched = json.loads(history.search_metadata)
+    db_session.refresh(f.history)
+    enriched = f.history.search_metadata
     assert enriched[0]["grab_confirmed"] is False
 
 
@@ -300,51 +240,37 @@ async def test_command_not_completed(db_session):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_radarr_grab_confirmed(db_session):
+async def test_radarr_grab_confirmed(db_session, mock_radarr_client):
     """Radarr completed command with hasFile=True -> grab confirmed."""
-    user_id = _make_user(db_session)
-    instance = _make_instance(db_session, instance_type="radarr", user_id=user_id)
-    lib_item = _make_library_item(
+    metadata = [
+        {
+            "item": "Inception (2010)",
+            "action": "MoviesSearch",
+            "item_id": 50,
+            "series_id": None,
+            "command_id": 800,
+            "result": "sent",
+        },
+    ]
+    f = _setup(
         db_session,
-        instance_id=instance.id,
-        external_id=50,
-        content_type="movie",
-        title="Inception",
+        instance_type="radarr",
+        metadata=metadata,
+        library_item={"external_id": 50, "content_type": "movie", "title": "Inception"},
     )
 
-    metadata = json.dumps(
-        [
-            {
-                "item": "Inception (2010)",
-                "action": "MoviesSearch",
-                "item_id": 50,
-                "series_id": None,
-                "command_id": 800,
-                "result": "sent",
-            },
-        ]
+    mock_radarr_client.get_command_status.return_value = {"status": "completed"}
+    mock_radarr_client.get_movies.return_value = {"id": 50, "hasFile": True}
+
+    service = FeedbackCheckService(db_session)
+    result = await service.check_search_results(
+        history_id=f.history.id, instance_id=f.instance.id
     )
-    history = _make_history(db_session, instance_id=instance.id, search_metadata=metadata)
-
-    with patch("splintarr.services.feedback.decrypt_api_key", return_value="a" * 32):
-        with patch("splintarr.services.feedback.RadarrClient") as MockClient:
-            mock_client = AsyncMock()
-            mock_client.get_command_status.return_value = {"status": "completed"}
-            mock_client.get_movies.return_value = {"id": 50, "hasFile": True}
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            MockClient.return_value = mock_client
-
-            service = FeedbackCheckService(db_session)
-            result = await service.check_search_results(
-                history_id=history.id, instance_id=instance.id
-            )
 
     assert result == {"checked": 1, "grabs": 1}
 
-    db_session.refresh(lib_item)
-    assert lib_item.grabs_confirmed == 1
+    db_session.refresh(f.lib_item)
+    assert f.lib_item.grabs_confirmed == 1
 
 
 # ---------------------------------------------------------------------------
@@ -352,59 +278,46 @@ async def test_radarr_grab_confirmed(db_session):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_client_exception_partial_results(db_session):
+async def test_client_exception_partial_results(db_session, mock_sonarr_client):
     """Client-level error during command check is caught; partial results returned."""
-    user_id = _make_user(db_session)
-    instance = _make_instance(db_session, instance_type="sonarr", user_id=user_id)
-
-    metadata = json.dumps(
-        [
-            {
-                "item": "Show A S01E01",
-                "action": "EpisodeSearch",
-                "item_id": 1,
-                "series_id": 1,
-                "command_id": 901,
-                "result": "sent",
-            },
-            {
-                "item": "Show B S01E01",
-                "action": "EpisodeSearch",
-                "item_id": 2,
-                "series_id": 2,
-                "command_id": 902,
-                "result": "sent",
-            },
-        ]
+    metadata = [
+        {
+            "item": "Show A S01E01",
+            "action": "EpisodeSearch",
+            "item_id": 1,
+            "series_id": 1,
+            "command_id": 901,
+            "result": "sent",
+        },
+        {
+            "item": "Show B S01E01",
+            "action": "EpisodeSearch",
+            "item_id": 2,
+            "series_id": 2,
+            "command_id": 902,
+            "result": "sent",
+        },
+    ]
+    f = _setup(db_session, instance_type="sonarr", metadata=metadata)
+
+    # First command succeeds (completed, file found); second raises
+    mock_sonarr_client.get_command_status.side_effect = [
+        {"status": "completed"},
+        Exception("API timeout"),
+    ]
+    mock_sonarr_client.get_episode.return_value = {"id": 1, "hasFile": True}
+
+    service = FeedbackCheckService(db_session)
+    result = await service.check_search_results(
+        history_id=f.history.id, instance_id=f.instance.id
     )
-    history = _make_history(db_session, instance_id=instance.id, search_metadata=metadata)
-
-    with patch("splintarr.services.feedback.decrypt_api_key", return_value="a" * 32):
-        with patch("splintarr.services.feedback.SonarrClient") as MockClient:
-            mock_client = AsyncMock()
-            # First command succeeds (completed, file found)
-            # Second command raises an exception
-            mock_client.get_command_status.side_effect = [
-                {"status": "completed"},
-                Exception("API timeout"),
-            ]
-            mock_client.get_episodes.return_value = [{"id": 1, "hasFile": True}]
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            MockClient.return_value = mock_client
-
-            service = FeedbackCheckService(db_session)
-            result = await service.check_search_results(
-                history_id=history.id, instance_id=instance.id
-            )
 
     # First command was checked successfully (grab), second had an error (unknown)
     assert result["checked"] == 2
     assert result["grabs"] == 1
 
-    db_session.refresh(history)
-    enriched = json.loads(history.search_metadata)
+    db_session.refresh(f.history)
+    enriched = f.history.search_metadata
     assert enriched[0]["grab_confirmed"] is True
     assert enriched[1]["grab_confirmed"] is None  # unknown due to error
 
@@ -414,19 +327,14 @@ async def test_client_exception_partial_results(db_session):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_invalid_metadata_json(db_session):
     """Invalid JSON in search_metadata returns {checked: 0, grabs: 0}."""
-    user_id = _make_user(db_session)
-    instance = _make_instance(db_session, user_id=user_id)
-    history = _make_history(
-        db_session,
-        instance_id=instance.id,
-        search_metadata="this is not json!",
-    )
+    f = _setup(db_session, metadata="this is not json!")
 
     service = FeedbackCheckService(db_session)
-    result = await service.check_search_results(history_id=history.id, instance_id=instance.id)
+    result = await service.check_search_results(
+        history_id=f.history.id, instance_id=f.instance.id
+    )
     assert result == {"checked": 0, "grabs": 0}
 
 
@@ -435,29 +343,23 @@ async def test_invalid_metadata_json(db_session):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_no_instance_record(db_session):
     """Missing instance returns {checked: 0, grabs: 0}."""
-    user_id = _make_user(db_session)
-    instance = _make_instance(db_session, user_id=user_id)
-
-    metadata = json.dumps(
-        [
-            {
-                "item": "Show S01E01",
-                "action": "EpisodeSearch",
-                "item_id": 1,
-                "series_id": 1,
-                "command_id": 100,
-                "result": "sent",
-            },
-        ]
-    )
-    history = _make_history(db_session, instance_id=instance.id, search_metadata=metadata)
+    metadata = [
+        {
+            "item": "Show S01E01",
+            "action": "EpisodeSearch",
+            "item_id": 1,
+            "series_id": 1,
+            "command_id": 100,
+            "result": "sent",
+        },
+    ]
+    f = _setup(db_session, metadata=metadata)
 
     service = FeedbackCheckService(db_session)
     # Use a non-existent instance_id
-    result = await service.check_search_results(history_id=history.id, instance_id=9999)
+    result = await service.check_search_results(history_id=f.history.id, instance_id=9999)
     assert result == {"checked": 0, "grabs": 0}
 
 
@@ -466,17 +368,12 @@ async def test_no_instance_record(db_session):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_metadata_not_a_list(db_session):
     """search_metadata that is valid JSON but not a list returns empty."""
-    user_id = _make_user(db_session)
-    instance = _make_instance(db_session, user_id=user_id)
-    history = _make_history(
-        db_session,
-        instance_id=instance.id,
-        search_metadata=json.dumps({"not": "a list"}),
-    )
+    f = _setup(db_session, metadata=json.dumps({"not": "a list"}))
 
     service = FeedbackCheckService(db_session)
-    result = await service.check_search_results(history_id=history.id, instance_id=instance.id)
+    result = await service.check_search_results(
+        history_id=f.history.id, instance_id=f.instance.id
+    )
     assert result == {"checked": 0, "grabs": 0}
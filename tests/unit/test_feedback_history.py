@@ -78,9 +78,7 @@ class TestCheckSonarrEpisodeViaHistory:
         """If command_issued_at is missing (old data), fall back to hasFile check."""
         service = FeedbackCheckService(db=None)
         mock_client = AsyncMock()
-        mock_client.get_episodes = AsyncMock(return_value=[
-            {"id": 42, "hasFile": True},
-        ])
+        mock_client.get_episode = AsyncMock(return_value={"id": 42, "hasFile": True})
 
         entry = {
             "item_id": 42,
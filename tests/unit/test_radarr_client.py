@@ -103,12 +103,12 @@ class TestRadarrClientContextManager:
             assert client._client is not None
             assert isinstance(client._client, httpx.AsyncClient)
 
-        # Client should be closed after exiting context
+        # Client should be detached after exiting context
         assert client._client is None
 
     @pytest.mark.asyncio
-    async def test_context_manager_closes_client(self):
-        """Test that context manager closes HTTP client."""
+    async def test_context_manager_detaches_client(self):
+        """Exiting the context detaches from the shared pool without closing it."""
         client = RadarrClient(
             url="https://radarr.example.com",
             api_key="a" * 32,
@@ -117,10 +117,17 @@ class TestRadarrClientContextManager:
         async with client:
             http_client = client._client
 
-        # Verify client was closed
+        # Client reference is released...
         assert client._client is None
-        # HTTP client should be closed
-        assert http_client.is_closed
+        # ...but the pooled httpx client stays open for reuse
+        assert not http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_clients_share_pooled_http_client(self):
+        """Two clients with identical config borrow the same pooled httpx client."""
+        kwargs = {"url": "https://radarr.example.com", "api_key": "a" * 32}
+        async with RadarrClient(**kwargs) as first, RadarrClient(**kwargs) as second:
+            assert first._client is second._client
 
 
 class TestRadarrRateLimiting:
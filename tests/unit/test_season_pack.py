@@ -188,10 +188,15 @@ class TestSeasonPackSchemaResponse:
     """Test season pack fields on SearchQueueResponse."""
 
     def test_response_includes_season_pack(self):
-        """SearchQueueResponse includes season pack fields."""
+        """SearchQueueResponse includes season pack fields.
+
+        model_construct skips validation — these tests only check attribute
+        echo and declared defaults; boundary validation is covered by the
+        Create/Update tests above.
+        """
         from datetime import UTC, datetime
 
-        resp = SearchQueueResponse(
+        resp = SearchQueueResponse.model_construct(
             id=1,
             instance_id=1,
             name="Test Queue",
@@ -212,7 +217,7 @@ class TestSeasonPackSchemaResponse:
         """SearchQueueResponse defaults: enabled=False, threshold=3."""
         from datetime import UTC, datetime
 
-        resp = SearchQueueResponse(
+        resp = SearchQueueResponse.model_construct(
             id=1,
             instance_id=1,
             name="Test Queue",
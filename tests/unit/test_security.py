@@ -22,7 +22,9 @@ from splintarr.core.security import (
     TokenGenerator,
     constant_time_compare,
     decrypt_field,
+    decrypt_webhook_url,
     encrypt_field,
+    encrypt_webhook_url,
     field_encryption,
     generate_token,
     hash_password,
@@ -30,6 +32,7 @@ from splintarr.core.security import (
     secure_comparison,
     token_generator,
     verify_password,
+    webhook_encryption,
 )
 
 
@@ -342,6 +345,76 @@ class TestFieldEncryption:
             field_encryption.decrypt(modified_ciphertext)
 
 
+class TestWebhookEncryption:
+    """Test AES-256-GCM encryption used for webhook URLs."""
+
+    def test_encrypt_produces_gcm_format(self):
+        """Ciphertext should carry the gcm1: prefix, not a Fernet token."""
+        plaintext = "https://discord.com/api/webhooks/123/abc"
+        ciphertext = webhook_encryption.encrypt(plaintext)
+
+        assert ciphertext.startswith("gcm1:")
+        assert not ciphertext.startswith("gAAAAA")
+        assert ciphertext != plaintext
+
+    def test_encrypt_decrypt_roundtrip(self):
+        """Encryption and decryption should be reversible."""
+        plaintext = "https://discord.com/api/webhooks/123/abc"
+        ciphertext = webhook_encryption.encrypt(plaintext)
+
+        assert webhook_encryption.decrypt(ciphertext) == plaintext
+
+    def test_encrypt_empty_raises_error(self):
+        """Empty plaintext should raise ValueError."""
+        with pytest.raises(ValueError, match="Plaintext cannot be empty"):
+            webhook_encryption.encrypt("")
+
+    def test_decrypt_empty_raises_error(self):
+        """Empty ciphertext should raise ValueError."""
+        with pytest.raises(ValueError, match="Ciphertext cannot be empty"):
+            webhook_encryption.decrypt("")
+
+    def test_encryption_produces_different_ciphertexts(self):
+        """Random nonces mean the same plaintext encrypts differently each time."""
+        plaintext = "https://discord.com/api/webhooks/123/abc"
+        ciphertext1 = webhook_encryption.encrypt(plaintext)
+        ciphertext2 = webhook_encryption.encrypt(plaintext)
+
+        assert ciphertext1 != ciphertext2
+        assert webhook_encryption.decrypt(ciphertext1) == plaintext
+        assert webhook_encryption.decrypt(ciphertext2) == plaintext
+
+    def test_decrypt_legacy_fernet_token(self):
+        """Webhook URLs encrypted with Fernet before the switch still decrypt."""
+        plaintext = "https://discord.com/api/webhooks/123/legacy"
+        legacy_ciphertext = field_encryption.encrypt(plaintext)
+
+        assert legacy_ciphertext.startswith("gAAAAA")
+        assert webhook_encryption.decrypt(legacy_ciphertext) == plaintext
+
+    def test_decrypt_tampered_data_raises_error(self):
+        """GCM authentication should reject tampered ciphertext."""
+        plaintext = "https://discord.com/api/webhooks/123/abc"
+        ciphertext = webhook_encryption.encrypt(plaintext)
+
+        # Modify one character in the middle of the payload
+        modified = list(ciphertext)
+        modified[20] = "X" if modified[20] != "X" else "Y"
+
+        with pytest.raises(EncryptionError):
+            webhook_encryption.decrypt("".join(modified))
+
+    def test_decrypt_unknown_format_raises_error(self):
+        """Values with neither prefix should be rejected, not passed through."""
+        with pytest.raises(EncryptionError, match="Unrecognized ciphertext format"):
+            webhook_encryption.decrypt("not-an-encrypted-value")
+
+    def test_convenience_functions(self):
+        """Test module-level convenience functions."""
+        plaintext = "https://discord.com/api/webhooks/456/def"
+        assert decrypt_webhook_url(encrypt_webhook_url(plaintext)) == plaintext
+
+
 class TestTokenGenerator:
     """Test cryptographically secure token generation."""
 